@@ -2,6 +2,7 @@ import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 import re
+import sys
 import time
 
 BASE = "https://www.espn.com/nba/attendance/_/year/{end_year}"
@@ -112,8 +113,14 @@ def scrape_attendance_range(start_end_year=2001, end_end_year=2025, sleep_sec=0.
 
     return out
 
-# === Run for 2000-01 through 2024-25 ===
-df = scrape_attendance_range(start_end_year=2001, end_end_year=2025, sleep_sec=0.2)
-print(df.head())
-df.to_csv("nba_attendance_2000-01_to_2024-25.csv", index=False)
-print("Saved: nba_attendance_2000-01_to_2024-25.csv")
+def main(start_end_year=2001, end_end_year=2025, out_file="nba_attendance_2000-01_to_2024-25.csv"):
+    # === Run for 2000-01 through 2024-25 ===
+    df = scrape_attendance_range(start_end_year=start_end_year, end_end_year=end_end_year, sleep_sec=0.2)
+    print(df.head())
+    df.to_csv(out_file, index=False)
+    print(f"Saved: {out_file}")
+    return 0 if len(df) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,7 @@ import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 import re
+import sys
 import time
 
 def scrape_espn_salaries_season(end_year, sleep_sec=0.3, session=None):
@@ -103,12 +104,18 @@ def scrape_espn_salaries_range(start_end_year=2001, end_end_year=2025, sleep_sec
         return pd.DataFrame(columns=["season", "Name", "Team", "Salary"])
 
 
-# === Run the full scrape ===
-# 2000-01 through 2024-25 corresponds to end years 2001..2025
-df = scrape_espn_salaries_range(start_end_year=2001, end_end_year=2025, sleep_sec=0.25)
+def main(start_end_year=2001, end_end_year=2025, out_file="nba_salaries_2000-01_to_2024-25.csv"):
+    # === Run the full scrape ===
+    # 2000-01 through 2024-25 corresponds to end years 2001..2025
+    df = scrape_espn_salaries_range(start_end_year=start_end_year, end_end_year=end_end_year, sleep_sec=0.25)
 
-# Save
-df.to_csv("nba_salaries_2000-01_to_2024-25.csv", index=False)
+    # Save
+    df.to_csv(out_file, index=False)
 
-print(df.head())
-print("Total rows:", len(df))
+    print(df.head())
+    print("Total rows:", len(df))
+    return 0 if len(df) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pandas as pd
+
+# Importable version of the per-player crawl in NBAAPIDataExtraction.ipynb.
+# Instead of three sequential endpoint calls with fixed 2.5s sleeps per player,
+# every (player, endpoint) call is submitted to one thread pool and paced by a
+# single global rate limiter, so network waits overlap while the request rate
+# to stats.nba.com stays bounded.
+
+AWARD_TYPES = {"NBA Most Valuable Player": "MVP", "NBA All-Star": "All-Star"}
+MAX_RETRIES = 5
+BASE_SLEEP = 1.5       # first retry delay, independent of the rate limiter's interval
+BACKOFF_FACTOR = 2     # exponential backoff multiplier
+
+
+class RateLimiter:
+    """Thread-safe limiter: at most one call starts every `min_interval` seconds, across all threads."""
+
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def call_with_retries(limiter, endpoint_cls, **kwargs):
+    """
+    Calls an nba_api endpoint under the rate limiter with exponential backoff.
+    Returns its first DataFrame, or None once MAX_RETRIES attempts have failed.
+    """
+    for attempt in range(1, MAX_RETRIES + 1):
+        limiter.wait()
+        try:
+            return endpoint_cls(timeout=60, **kwargs).get_data_frames()[0]
+        except Exception as e:
+            if attempt == MAX_RETRIES:
+                print(f"  !! {endpoint_cls.__name__}({kwargs}) failed after {MAX_RETRIES} attempts: {e}")
+                return None
+            time.sleep(BASE_SLEEP * BACKOFF_FACTOR ** (attempt - 1))
+
+
+def fetch_player_endpoints(player_id, limiter):
+    """Returns (endpoint name, callable) pairs for the independent per-player calls."""
+    from nba_api.stats.endpoints import commonplayerinfo, playercareerstats, playerawards
+
+    return [
+        ("info", lambda: call_with_retries(limiter, commonplayerinfo.CommonPlayerInfo, player_id=player_id)),
+        ("career", lambda: call_with_retries(limiter, playercareerstats.PlayerCareerStats, player_id=player_id)),
+        ("awards", lambda: call_with_retries(limiter, playerawards.PlayerAwards, player_id=player_id)),
+    ]
+
+
+# --- Record builders (same output columns as the notebook) ---
+
+def build_player_info(pid, info):
+    return {
+        "Player_ID": pid,
+        "FullName": info.at[0, "DISPLAY_FIRST_LAST"],
+        "FirstName": info.at[0, "FIRST_NAME"],
+        "LastName": info.at[0, "LAST_NAME"],
+        "Position": info.at[0, "POSITION"],
+        "DateOfBirth": info.at[0, "BIRTHDATE"],
+        "Height": info.at[0, "HEIGHT"],
+        "Weight": info.at[0, "WEIGHT"],
+        "SeasonExperience": info.at[0, "SEASON_EXP"]
+    }
+
+def build_draft_info(pid, name, info):
+    """Returns the draft record, or None for undrafted players."""
+    draft_year = info.at[0, "DRAFT_YEAR"]
+    if str(draft_year).lower() == "undrafted" or pd.isna(draft_year):
+        return None
+    return {
+        "Draft_ID": f"{pid}-{draft_year}",
+        "Player_ID": pid,
+        "Player Name": name,
+        "DraftYear": draft_year,
+        "DraftRound": info.at[0, "DRAFT_ROUND"],
+        "DraftPick": info.at[0, "DRAFT_NUMBER"],
+        # Filled in from the first stint in the career history
+        "DraftTeam": None,
+        "DraftTeamID": None
+    }
+
+def build_stints(pid, name, career, current_team_id):
+    """Groups career rows into continuous stints with the same team."""
+    career_sorted = career.sort_values("SEASON_ID").reset_index(drop=True)
+    career_sorted["TeamChange"] = (career_sorted["TEAM_ID"] != career_sorted["TEAM_ID"].shift(1)).astype(int)
+    career_sorted["Stint_ID"] = career_sorted["TeamChange"].cumsum()
+
+    stints = (
+        career_sorted.groupby(["Stint_ID", "TEAM_ID", "TEAM_ABBREVIATION"], as_index=False)
+        .agg(StartSeason=("SEASON_ID", "min"), EndSeason=("SEASON_ID", "max"))
+    )
+    stints["Player_ID"] = pid
+    stints["Player_Name"] = name
+    stints["IsCurrent"] = stints["TEAM_ID"] == current_team_id
+    return stints
+
+def build_awards(pid, name, awards_df):
+    filtered = awards_df[awards_df["DESCRIPTION"].isin(list(AWARD_TYPES))]
+    return pd.DataFrame({
+        "Player_ID": pid,
+        "Player_Name": name,
+        "Season": filtered["SEASON"].values,
+        "Award": filtered["DESCRIPTION"].values,
+        "Award_Type": filtered["DESCRIPTION"].map(AWARD_TYPES).values,
+    })
+
+
+# --- Crawl ---
+
+def crawl_players(player_list, max_workers=8, min_interval=0.75):
+    """
+    Crawls info, career stints, draft and awards for each player in `player_list`
+    (dicts with 'id' and 'full_name', as returned by nba_api's players.get_active_players()).
+    Returns (player_info_df, draft_info_df, team_history_df, awards_info_df).
+    """
+    limiter = RateLimiter(min_interval)
+    names = {p["id"]: p["full_name"] for p in player_list}
+    results = {pid: {} for pid in names}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for pid in names:
+            for endpoint, call in fetch_player_endpoints(pid, limiter):
+                futures[executor.submit(call)] = (pid, endpoint)
+
+        done_players = 0
+        for future in as_completed(futures):
+            pid, endpoint = futures[future]
+            results[pid][endpoint] = future.result()
+            if len(results[pid]) == 3:
+                done_players += 1
+                print(f"{done_players}/{len(names)}. Fetched data for {names[pid]}")
+
+    player_info_list = []
+    draft_info = {}  # Player_ID -> draft record
+    team_history_list = []
+    awards_list = []
+
+    for pid, name in names.items():
+        info, career, awards_df = results[pid]["info"], results[pid]["career"], results[pid]["awards"]
+        if info is None or info.empty:
+            print(f"Skipping {name}: no player info.")
+            continue
+
+        # Build every record for the player before keeping any, so one malformed
+        # response skips that player instead of aborting the whole crawl
+        try:
+            player_info = build_player_info(pid, info)
+            draft = build_draft_info(pid, name, info)
+            stints = None
+            if career is not None and not career.empty:
+                stints = build_stints(pid, name, career, info.at[0, "TEAM_ID"])
+                # Infer draft team from the first stint
+                if draft is not None:
+                    first_stint = stints.sort_values("StartSeason").iloc[0]
+                    draft["DraftTeam"] = first_stint["TEAM_ABBREVIATION"]
+                    draft["DraftTeamID"] = first_stint["TEAM_ID"]
+            awards = build_awards(pid, name, awards_df) if awards_df is not None and not awards_df.empty else None
+        except Exception as e:
+            print(f"Error building records for {name}: {e}")
+            continue
+
+        player_info_list.append(player_info)
+        if draft is not None:
+            draft_info[pid] = draft
+        if stints is not None:
+            team_history_list.append(stints)
+        if awards is not None:
+            awards_list.append(awards)
+
+    player_info_df = pd.DataFrame(player_info_list)
+    draft_info_df = pd.DataFrame(list(draft_info.values()))
+    team_history_df = (
+        pd.concat(team_history_list, ignore_index=True)[
+            ["Player_ID", "Player_Name", "TEAM_ID", "TEAM_ABBREVIATION", "StartSeason", "EndSeason", "IsCurrent"]
+        ]
+        .rename(columns={"TEAM_ABBREVIATION": "TeamAbbr"})
+        if team_history_list else pd.DataFrame()
+    )
+    awards_info_df = pd.concat(awards_list, ignore_index=True) if awards_list else pd.DataFrame()
+    return player_info_df, draft_info_df, team_history_df, awards_info_df
+
+
+def main(max_workers=8, min_interval=0.75, limit=None, out_dir="."):
+    from nba_api.stats.static import players
+
+    active_players = players.get_active_players()
+    if limit:
+        active_players = active_players[:limit]
+    print(f"Crawling {len(active_players)} active players...")
+
+    player_info_df, draft_info_df, team_history_df, awards_info_df = crawl_players(
+        active_players, max_workers=max_workers, min_interval=min_interval
+    )
+
+    # File names match what DataImport.preprocess_data reads from its data directory
+    os.makedirs(out_dir, exist_ok=True)
+    for df, file_name in [
+        (player_info_df, "player.csv"),
+        (draft_info_df, "player draft.csv"),
+        (team_history_df, "player team history.csv"),
+        (awards_info_df, "player awards.csv"),
+    ]:
+        out_file = os.path.join(out_dir, file_name)
+        df.to_csv(out_file, index=False)
+        print(f"Saved {len(df)} rows to {out_file}")
+    return 0 if len(player_info_df) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
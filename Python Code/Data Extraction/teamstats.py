@@ -1,5 +1,6 @@
 import requests
 import pandas as pd
+import sys
 import time
 
 BASE_URL = "https://site.web.api.espn.com/apis/v2/sports/basketball/nba/standings"
@@ -67,9 +68,10 @@ def get_season_standings(season_year: int) -> pd.DataFrame:
     return df
 
 
-def main():
+def main(start_end_year=2003, end_end_year=2025,
+         out_file="nba_standings_2002_2003_to_2024_2025_espn.csv"):
     # ESPN uses the end year: 2003 = 2002-2003 season, 2025 = 2024-2025
-    season_years = range(2003, 2026)  # 2003..2025 inclusive
+    season_years = range(start_end_year, end_end_year + 1)  # 2003..2025 inclusive
 
     all_seasons = []
     for season in season_years:
@@ -83,7 +85,7 @@ def main():
 
     if not all_seasons:
         print("No data downloaded.")
-        return
+        return 1
 
     df_all = pd.concat(all_seasons, ignore_index=True)
 
@@ -91,10 +93,10 @@ def main():
     df_all = df_all[["season", "league_rank", "team_name",
                      "wins", "losses", "home", "road"]]
 
-    out_file = "nba_standings_2002_2003_to_2024_2025_espn.csv"
     df_all.to_csv(out_file, index=False)
     print(f"Saved {len(df_all)} rows to {out_file}")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,16 +1,13 @@
+import os
+import sys
 import pandas as pd
-import mysql.connector
-from mysql.connector import errorcode
 import numpy as np
 import warnings
+from DataValidation import validate_tables
+from PlayerTeamTimeline import PlayerTeamTimeline
 
-# Suppress SettingWithCopyWarning, adjusting for different Pandas versions
-try:
-    # Modern Pandas (>= 1.5)
-    warnings.filterwarnings('ignore', category=pd.errors.SettingWithCopyWarning)
-except AttributeError:
-    # Older Pandas (< 1.5)
-    warnings.filterwarnings('ignore', category=pd.core.common.SettingWithCopyWarning)
+# mysql.connector is imported inside the functions that talk to the database,
+# so preprocessing-only runs don't pay for it (or need it installed).
 
 
 # --- Configuration ---
@@ -23,6 +20,15 @@ DB_CONFIG = {
 
 # --- Helper Functions ---
 
+def suppress_setting_with_copy_warning():
+    """Suppress SettingWithCopyWarning, adjusting for different Pandas versions."""
+    try:
+        # Modern Pandas (>= 1.5)
+        warnings.filterwarnings('ignore', category=pd.errors.SettingWithCopyWarning)
+    except AttributeError:
+        # Older Pandas (< 1.5)
+        warnings.filterwarnings('ignore', category=pd.core.common.SettingWithCopyWarning)
+
 def convert_season(season):
     """
     Standardizes the season string format to 'YYYY-YY'.
@@ -64,24 +70,25 @@ def load_csv_data(file_path):
         print(f"Error reading {file_path}: {e}. Skipping.")
         return None
 
-def preprocess_data():
+def preprocess_data(data_dir='.'):
     """Reads, cleans, and transforms all necessary CSV data into DataFrames ready for insertion."""
     print("Starting data preprocessing...")
+    suppress_setting_with_copy_warning()
 
     # Load all raw files
     raw_dfs = {
-        'teams': load_csv_data('teams.csv'),
-        'player': load_csv_data('player.csv'),
-        'history': load_csv_data('player team history.csv'),
-        'awards_raw': load_csv_data('player awards.csv'),
-        'stats_raw': load_csv_data('Player data.csv'),
-        'standings_raw': load_csv_data('nba_standings_2002_2003_to_2024_2025_espn.csv'),
-        'attendance_raw': load_csv_data('nba_attendance_2000-01_to_2024-25.csv'),
-        'salaries_raw': load_csv_data('nba_salaries_2000-01_to_2024-25.csv')
+        'teams': load_csv_data(os.path.join(data_dir, 'teams.csv')),
+        'player': load_csv_data(os.path.join(data_dir, 'player.csv')),
+        'history': load_csv_data(os.path.join(data_dir, 'player team history.csv')),
+        'awards_raw': load_csv_data(os.path.join(data_dir, 'player awards.csv')),
+        'stats_raw': load_csv_data(os.path.join(data_dir, 'Player data.csv')),
+        'standings_raw': load_csv_data(os.path.join(data_dir, 'nba_standings_2002_2003_to_2024_2025_espn.csv')),
+        'attendance_raw': load_csv_data(os.path.join(data_dir, 'nba_attendance_2000-01_to_2024-25.csv')),
+        'salaries_raw': load_csv_data(os.path.join(data_dir, 'nba_salaries_2000-01_to_2024-25.csv'))
     }
     if any(df is None for key, df in raw_dfs.items() if key != 'draft'):
         print("Required CSV files are missing or could not be loaded. Aborting preprocessing.")
-        return None, None, None, None, None, None, None 
+        return None, None, None, None, None, None, None, None
 
     # --- 1. team table processing ---
     teams_df = raw_dfs['teams']
@@ -128,8 +135,8 @@ def preprocess_data():
     current_teams.drop_duplicates(subset=['Player_ID'], keep='first', inplace=True)
 
     player_df = pd.merge(player_df, current_teams[['Player_ID', 'TEAM_ID']], on='Player_ID', how='left')
-    player_df = player_df.dropna(subset=['TEAM_ID']).copy()
-    player_df['TEAM_ID'] = player_df['TEAM_ID'].astype(int)
+    # Players without a current team keep a null TeamID; validate_tables rejects them with a reason
+    player_df['TEAM_ID'] = player_df['TEAM_ID'].astype('Int64')
 
     player_df.rename(columns={
         'Player_ID': 'PlayerID', 'FullName': 'Name', 'TEAM_ID': 'TeamID',
@@ -144,20 +151,18 @@ def preprocess_data():
     
     # Create PlayerName-to-PlayerID mapping for salary joins
     player_name_to_id = player_df.set_index('Name')['PlayerID'].to_dict()
-    print(f"-> Processed {len(player_df)} players with current teams.")
+    print(f"-> Processed {len(player_df)} players ({int(player_df['TeamID'].isna().sum())} without a current team).")
 
     # --- 4. playeraward table processing ---
     player_awards_df = awards_raw_df.copy()
     # Standardize Season format
     player_awards_df['Season'] = player_awards_df['Season'].apply(convert_season)
-    player_awards_df = player_awards_df.dropna(subset=['Season']).copy()
 
     player_awards_df = pd.merge(
         player_awards_df, award_type_df[['AwardName', 'AwardTypeID']],
         left_on='Award', right_on='AwardName', how='left'
     )
-    player_awards_df.dropna(subset=['AwardTypeID', 'Player_ID'], inplace=True)
-    player_awards_df['AwardTypeID'] = player_awards_df['AwardTypeID'].astype(int)
+    player_awards_df['AwardTypeID'] = player_awards_df['AwardTypeID'].astype('Int64')
 
     player_awards_df['PlayerAwardID'] = np.arange(1, len(player_awards_df) + 1)
     player_awards_df.rename(columns={'Player_ID': 'PlayerID'}, inplace=True)
@@ -165,12 +170,10 @@ def preprocess_data():
     print(f"-> Processed {len(player_award_final_df)} player awards.")
 
     # --- 5. playerstat table processing ---
-    player_stat_df = raw_dfs['stats_raw']
-    player_stat_df = player_stat_df.dropna(subset=['Player_ID']).copy()
-    player_stat_df['PlayerID'] = player_stat_df['Player_ID'].astype(int)
+    player_stat_df = raw_dfs['stats_raw'].copy()
+    player_stat_df['PlayerID'] = player_stat_df['Player_ID'].astype('Int64')
     # Standardize Season format
     player_stat_df['Season'] = player_stat_df['Season'].apply(convert_season)
-    player_stat_df = player_stat_df.dropna(subset=['Season']).copy()
 
     # Rename and round columns
     player_stat_df.rename(columns={
@@ -196,14 +199,17 @@ def preprocess_data():
         'StealsPerGame', 'BlocksPerGame', 'TurnoversPerGame', 'MinutesPlayedPerGame',
         'FieldGoalPercentage', 'ThreePointPercentage', 'FreeThrowPercentage'
     ]].copy()
-    player_stat_final_df.drop_duplicates(subset=['PlayerID', 'Season'], keep='first', inplace=True)
+    # Duplicate (PlayerID, Season) rows are reported and dropped by the validation stage
     print(f"-> Processed {len(player_stat_final_df)} player season stats.")
 
     # --- 6. salary table processing ---
+    # Interval index over the history stints, used to attribute each salary to the team
+    # the player was on that season (and to build the playerteamseason table in step 8)
+    timeline = PlayerTeamTimeline.from_history(history_df)
+
     salaries_df = raw_dfs['salaries_raw'].copy()
     # Standardize Season format
     salaries_df['Season'] = salaries_df['season'].apply(convert_season)
-    salaries_df.dropna(subset=['Name', 'Season'], inplace=True)
     
     salaries_df['SalaryAmount'] = (
         salaries_df['Salary']
@@ -216,11 +222,16 @@ def preprocess_data():
     
     salaries_df['PlayerID'] = salaries_df['Name'].map(player_name_to_id)
     
-    # Filter for players found in the Player table and drop rows where salary conversion failed
-    salaries_final_df = salaries_df.dropna(subset=['PlayerID', 'SalaryAmount']).copy()
-    salaries_final_df['PlayerID'] = salaries_final_df['PlayerID'].astype(int)
+    # Names not found in the Player table and amounts that failed to convert stay null,
+    # so validate_tables rejects them with a reason instead of them vanishing here
+    salaries_final_df = salaries_df.copy()
+    salaries_final_df['PlayerID'] = salaries_final_df['PlayerID'].astype('Int64')
     salaries_final_df['SalaryID'] = np.arange(1, len(salaries_final_df) + 1)
-    salaries_final_df = salaries_final_df[['SalaryID', 'PlayerID', 'SalaryAmount', 'Season']].copy()
+    salaries_final_df['TeamID'] = pd.Series(timeline.team_for(
+        salaries_final_df['PlayerID'].to_numpy(dtype=float, na_value=np.nan),
+        salaries_final_df['Season'].to_numpy(),
+    ), index=salaries_final_df.index).astype('Int64')
+    salaries_final_df = salaries_final_df[['SalaryID', 'PlayerID', 'TeamID', 'SalaryAmount', 'Season']].copy()
     print(f"-> Processed {len(salaries_final_df)} player salaries.")
 
     # --- 7. teamseasonstat table processing ---
@@ -231,7 +242,6 @@ def preprocess_data():
     standings_df.rename(columns={'season': 'Season', 'team_name': 'TeamName', 'wins': 'Wins', 'losses': 'Losses', 'league_rank': 'SeasonRank'}, inplace=True)
     # Standardize Season format
     standings_df['Season'] = standings_df['Season'].apply(convert_season)
-    standings_df.dropna(subset=['Season', 'TeamName'], inplace=True)
     
     # FIX: Robust splitting logic for home/road records
     standings_df['home'] = standings_df['home'].astype(str)
@@ -253,11 +263,11 @@ def preprocess_data():
     standings_df.loc[:, 'AwayWins'] = road_split_cols[0]
     standings_df.loc[:, 'AwayLosses'] = road_split_cols[1]
     
-    # Convert extracted win/loss columns to numeric
-    standings_df['HomeWins'] = pd.to_numeric(standings_df['HomeWins'], errors='coerce').fillna(0).astype(int)
-    standings_df['HomeLosses'] = pd.to_numeric(standings_df['HomeLosses'], errors='coerce').fillna(0).astype(int)
-    standings_df['AwayWins'] = pd.to_numeric(standings_df['AwayWins'], errors='coerce').fillna(0).astype(int)
-    standings_df['AwayLosses'] = pd.to_numeric(standings_df['AwayLosses'], errors='coerce').fillna(0).astype(int)
+    # Convert extracted win/loss columns to numeric; unparseable splits stay null for validation to reject
+    standings_df['HomeWins'] = pd.to_numeric(standings_df['HomeWins'], errors='coerce').astype('Int64')
+    standings_df['HomeLosses'] = pd.to_numeric(standings_df['HomeLosses'], errors='coerce').astype('Int64')
+    standings_df['AwayWins'] = pd.to_numeric(standings_df['AwayWins'], errors='coerce').astype('Int64')
+    standings_df['AwayLosses'] = pd.to_numeric(standings_df['AwayLosses'], errors='coerce').astype('Int64')
 
     standings_df.drop(columns=['home', 'road', 'HomeLosses', 'AwayLosses'], inplace=True)
     
@@ -266,7 +276,7 @@ def preprocess_data():
     # Standardize Season format
     attendance_df['Season'] = attendance_df['Season'].apply(convert_season)
     attendance_df.dropna(subset=['Season', 'TeamName'], inplace=True)
-    attendance_df['AttendanceCount'] = attendance_df['AttendanceCount'].astype(int) 
+    attendance_df['AttendanceCount'] = attendance_df['AttendanceCount'].astype('Int64')
 
     # Merge Standings and Attendance
     team_stats_df = pd.merge(
@@ -298,23 +308,32 @@ def preprocess_data():
     team_stats_df['StandardTeamName'] = team_stats_df['TeamName'].map(team_name_mapping).fillna(team_stats_df['TeamName'])
     team_stats_df['TeamID'] = team_stats_df['StandardTeamName'].map(team_name_to_id)
     
-    # Final cleanup and selection
-    team_stats_final_df = team_stats_df.dropna(subset=['TeamID', 'Season']).copy()
-    team_stats_final_df['TeamID'] = team_stats_final_df['TeamID'].astype(int)
-    team_stats_final_df['AttendanceCount'] = team_stats_final_df['AttendanceCount'].fillna(0).astype(int)
+    # Final cleanup and selection. Unmapped team names keep a null TeamID (rejected by
+    # validate_tables), and seasons without attendance data load a NULL AttendanceCount.
+    team_stats_final_df = team_stats_df.copy()
+    team_stats_final_df['TeamID'] = team_stats_final_df['TeamID'].astype('Int64')
     
     team_stats_final_df = team_stats_final_df[['TeamID', 'Season', 'Wins', 'Losses', 'HomeWins', 'AwayWins', 'AttendanceCount', 'SeasonRank']].copy()
-    team_stats_final_df.drop_duplicates(subset=['TeamID', 'Season'], keep='first', inplace=True)
+    # Duplicate (TeamID, Season) rows are reported and dropped by the validation stage
     print(f"-> Processed {len(team_stats_final_df)} team season stats.")
 
+    # --- 8. playerteamseason table processing ---
+    # One row per (player, season), expanded from the timeline built in step 6 rather
+    # than a merge. Traded players get a single best-guess team for that season;
+    # see PlayerTeamTimeline.resolve_season_teams for the tie-break rules.
+    player_team_season_df = timeline.player_team_seasons()
+    print(f"-> Processed {len(player_team_season_df)} player team seasons from {len(timeline)} team intervals.")
 
-    return teams_df, award_type_df, player_df, player_award_final_df, player_stat_final_df, salaries_final_df, team_stats_final_df
+
+    return teams_df, award_type_df, player_df, player_award_final_df, player_stat_final_df, salaries_final_df, team_stats_final_df, player_team_season_df
 
 def insert_data_to_mysql(conn, cursor, table_name, df, columns):
-    """Dynamically creates and executes INSERT statements for a given DataFrame."""
+    """Dynamically creates and executes INSERT statements for a given DataFrame. Returns False if the insert failed."""
+    import mysql.connector
+
     if df.empty:
         print(f"  [SKIPPED] {table_name}: DataFrame is empty.")
-        return
+        return True
 
     # Build the INSERT query
     cols = ', '.join([f'`{col}`' for col in columns])
@@ -327,7 +346,7 @@ def insert_data_to_mysql(conn, cursor, table_name, df, columns):
         # Convert pandas/numpy types to native Python types (int, float, str, None)
         data_row = []
         for val in row[columns]:
-            if pd.options.mode.use_inf_as_na and pd.isna(val):
+            if pd.isna(val):
                 data_row.append(None)
             elif isinstance(val, (np.int64, np.int32)):
                 data_row.append(int(val))
@@ -343,19 +362,38 @@ def insert_data_to_mysql(conn, cursor, table_name, df, columns):
         cursor.executemany(insert_query, data_to_insert)
         conn.commit()
         print(f"  [SUCCESS] {table_name} populated.")
+        return True
     except mysql.connector.Error as err:
         print(f"  [ERROR] Failed to insert data into {table_name}: {err.msg}")
         conn.rollback()
+        return False
+
+def main(data_dir='.', reject_file='rejects.csv'):
+    """Main function to run the ETL process. Returns 0 on success and 1 if any step failed."""
+    import mysql.connector
+    from mysql.connector import errorcode
 
-def main():
-    """Main function to run the ETL process."""
     # 1. Preprocess data
-    teams_df, award_type_df, player_df, player_award_df, player_stat_df, salaries_df, team_stats_df = preprocess_data()
+    teams_df, award_type_df, player_df, player_award_df, player_stat_df, salaries_df, team_stats_df, player_team_season_df = preprocess_data(data_dir)
     
     if teams_df is None:
-        return
-
-    # 2. Database connection
+        return 1
+
+    # 2. Validate every table before touching the database, so bad rows are
+    # rejected up front instead of failing (and rolling back) a whole insert.
+    # Tables are ordered parents-first to respect FK constraints.
+    tables, _ = validate_tables({
+        'team': teams_df,
+        'awardtype': award_type_df,
+        'player': player_df,
+        'playeraward': player_award_df,
+        'playerstat': player_stat_df,
+        'salary': salaries_df,
+        'teamseasonstat': team_stats_df,
+        'playerteamseason': player_team_season_df,
+    }, reject_file=reject_file)
+
+    # 3. Database connection
     try:
         print(f"\nAttempting to connect to MySQL database: {DB_CONFIG['database']}...")
         conn = mysql.connector.connect(**DB_CONFIG)
@@ -369,28 +407,47 @@ def main():
             print("ERROR: Database does not exist. Please create the 'NBAdatabase' first.")
         else:
             print(f"ERROR: {err}")
-        return
+        return 1
 
-    # 3. Insert data into tables (respecting FK constraints)
+    # The playerteamseason table and salary.TeamID come from playerteamseason.sql; a database
+    # that hasn't applied it yet still gets every other table and column loaded.
+    cursor.execute(
+        "SELECT TABLE_NAME, COLUMN_NAME FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = DATABASE()"
+    )
+    db_columns = {}
+    for table_name, column_name in cursor.fetchall():
+        db_columns.setdefault(table_name.lower(), set()).add(column_name)
+    if 'TeamID' not in db_columns.get('salary', set()):
+        print("  [NOTE] salary.TeamID does not exist; loading salaries without it (apply playerteamseason.sql).")
+        tables['salary'] = tables['salary'].drop(columns=['TeamID'])
+
+    # 4. Insert data into tables (respecting FK constraints)
     print("\nStarting data insertion into NBAdatabase...")
 
+    results = []
+
     # Group 1: Base Tables (No External FKs)
-    insert_data_to_mysql(conn, cursor, 'team', teams_df, teams_df.columns.tolist())
-    insert_data_to_mysql(conn, cursor, 'awardtype', award_type_df, award_type_df.columns.tolist())
+    results.append(insert_data_to_mysql(conn, cursor, 'team', tables['team'], tables['team'].columns.tolist()))
+    results.append(insert_data_to_mysql(conn, cursor, 'awardtype', tables['awardtype'], tables['awardtype'].columns.tolist()))
 
     # Group 2: Player-Related (Requires TeamID)
-    insert_data_to_mysql(conn, cursor, 'player', player_df, player_df.columns.tolist())
+    results.append(insert_data_to_mysql(conn, cursor, 'player', tables['player'], tables['player'].columns.tolist()))
 
     # Group 3: Stats/Awards/Salary (Requires PlayerID/TeamID/AwardTypeID)
-    insert_data_to_mysql(conn, cursor, 'playeraward', player_award_df, player_award_df.columns.tolist())
-    insert_data_to_mysql(conn, cursor, 'playerstat', player_stat_df, player_stat_df.columns.tolist())
-    insert_data_to_mysql(conn, cursor, 'salary', salaries_df, salaries_df.columns.tolist())
-    insert_data_to_mysql(conn, cursor, 'teamseasonstat', team_stats_df, team_stats_df.columns.tolist())
-
-    # 4. Cleanup
+    results.append(insert_data_to_mysql(conn, cursor, 'playeraward', tables['playeraward'], tables['playeraward'].columns.tolist()))
+    results.append(insert_data_to_mysql(conn, cursor, 'playerstat', tables['playerstat'], tables['playerstat'].columns.tolist()))
+    results.append(insert_data_to_mysql(conn, cursor, 'salary', tables['salary'], tables['salary'].columns.tolist()))
+    results.append(insert_data_to_mysql(conn, cursor, 'teamseasonstat', tables['teamseasonstat'], tables['teamseasonstat'].columns.tolist()))
+    if 'playerteamseason' in db_columns:
+        results.append(insert_data_to_mysql(conn, cursor, 'playerteamseason', tables['playerteamseason'], tables['playerteamseason'].columns.tolist()))
+    else:
+        print("  [SKIPPED] playerteamseason: table does not exist (apply playerteamseason.sql).")
+
+    # 5. Cleanup
     cursor.close()
     conn.close()
     print("\nData loading complete and connection closed.")
+    return 0 if all(results) else 1
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,202 @@
+import numpy as np
+import pandas as pd
+
+# --- Schema ---
+# Every check below works on whole columns at once, so the full set of tables
+# can be validated in well under a second before a single row is inserted.
+
+SEASON_PATTERN = r'\d{4}-\d{2}'
+
+# table -> {column: (kind, min, max, nullable)}
+# kind is 'int', 'float', 'str', 'season' or 'date' ('YYYY-MM-DD'); min/max are ignored for non-numeric kinds.
+COLUMN_RULES = {
+    'team': {
+        'TeamID': ('int', 1, None, False),
+        'TeamName': ('str', None, None, False),
+    },
+    'awardtype': {
+        'AwardTypeID': ('int', 1, None, False),
+        'AwardName': ('str', None, None, False),
+    },
+    'player': {
+        'PlayerID': ('int', 1, None, False),
+        'TeamID': ('int', 1, None, False),
+        'Name': ('str', None, None, False),
+        'DateOfBirth': ('date', None, None, False),
+        'Weight': ('float', 100, 400, True),
+        'SeasonExperience': ('int', 0, 30, True),
+    },
+    'playeraward': {
+        'PlayerAwardID': ('int', 1, None, False),
+        'PlayerID': ('int', 1, None, False),
+        'AwardTypeID': ('int', 1, None, False),
+        'Season': ('season', None, None, False),
+    },
+    'playerstat': {
+        'PlayerID': ('int', 1, None, False),
+        'Season': ('season', None, None, False),
+        'PointsPerGame': ('float', 0, 100, True),
+        'AssistsPerGame': ('float', 0, 50, True),
+        'ReboundsPerGame': ('float', 0, 50, True),
+        'StealsPerGame': ('float', 0, 20, True),
+        'BlocksPerGame': ('float', 0, 20, True),
+        'TurnoversPerGame': ('float', 0, 20, True),
+        'MinutesPlayedPerGame': ('float', 0, 65, True),
+        'FieldGoalPercentage': ('float', 0, 1, True),
+        'ThreePointPercentage': ('float', 0, 1, True),
+        'FreeThrowPercentage': ('float', 0, 1, True),
+    },
+    'salary': {
+        'SalaryID': ('int', 1, None, False),
+        'PlayerID': ('int', 1, None, False),
+        'TeamID': ('int', 1, None, True),
+        'SalaryAmount': ('float', 1, 500_000_000, False),
+        'Season': ('season', None, None, False),
+    },
+    'teamseasonstat': {
+        'TeamID': ('int', 1, None, False),
+        'Season': ('season', None, None, False),
+        'Wins': ('int', 0, 82, False),
+        'Losses': ('int', 0, 82, False),
+        'HomeWins': ('int', 0, 41, False),
+        'AwayWins': ('int', 0, 41, False),
+        'AttendanceCount': ('int', 0, 100_000, True),
+        'SeasonRank': ('int', 1, 30, False),
+    },
+    'playerteamseason': {
+        'PlayerID': ('int', 1, None, False),
+        'TeamID': ('int', 1, None, False),
+        'Season': ('season', None, None, False),
+    },
+}
+
+# table -> columns that must be unique (the table's primary or natural key)
+UNIQUE_KEYS = {
+    'team': ['TeamID'],
+    'awardtype': ['AwardTypeID'],
+    'player': ['PlayerID'],
+    'playeraward': ['PlayerAwardID'],
+    'playerstat': ['PlayerID', 'Season'],
+    'salary': ['SalaryID'],
+    'teamseasonstat': ['TeamID', 'Season'],
+    'playerteamseason': ['PlayerID', 'Season'],
+}
+
+# table -> [(column, parent table, parent column)]
+FOREIGN_KEYS = {
+    'player': [('TeamID', 'team', 'TeamID')],
+    'playeraward': [('PlayerID', 'player', 'PlayerID'), ('AwardTypeID', 'awardtype', 'AwardTypeID')],
+    'playerstat': [('PlayerID', 'player', 'PlayerID')],
+    'salary': [('PlayerID', 'player', 'PlayerID'), ('TeamID', 'team', 'TeamID')],
+    'teamseasonstat': [('TeamID', 'team', 'TeamID')],
+    'playerteamseason': [('PlayerID', 'player', 'PlayerID'), ('TeamID', 'team', 'TeamID')],
+}
+
+
+# --- Checks ---
+
+def check_columns(df, rules):
+    """Returns a list of (check name, boolean mask of failing rows) for type, null and range rules."""
+    failures = []
+    for col, (kind, low, high, nullable) in rules.items():
+        if col not in df.columns:
+            failures.append((f'{col}:missing_column', pd.Series(True, index=df.index)))
+            continue
+
+        values = df[col]
+        missing = values.isna()
+        if kind in ('str', 'date'):
+            # preprocess_data casts some columns with astype(str), which turns NaN into 'nan'
+            missing |= values.astype(str).str.strip().isin(['', 'nan', 'None', 'NaT'])
+        if not nullable:
+            failures.append((f'{col}:null', missing))
+
+        if kind == 'season':
+            bad_type = ~missing & ~values.astype(str).str.fullmatch(SEASON_PATTERN)
+            failures.append((f'{col}:type', bad_type))
+        elif kind == 'date':
+            bad_type = ~missing & pd.to_datetime(values, format='%Y-%m-%d', errors='coerce').isna()
+            failures.append((f'{col}:type', bad_type))
+        elif kind in ('int', 'float'):
+            numeric = pd.to_numeric(values, errors='coerce')
+            bad_type = ~missing & numeric.isna()
+            if kind == 'int':
+                bad_type |= numeric.notna() & (numeric % 1 != 0)
+            failures.append((f'{col}:type', bad_type))
+
+            out_of_range = pd.Series(False, index=df.index)
+            if low is not None:
+                out_of_range |= numeric < low
+            if high is not None:
+                out_of_range |= numeric > high
+            failures.append((f'{col}:range', out_of_range))
+    return failures
+
+def check_unique(df, key, eligible):
+    """
+    Flags every row after the first that repeats the given key, among `eligible` rows only,
+    so a row that already failed another check can't knock out a valid row with the same key.
+    """
+    duplicate = np.zeros(len(df), dtype=bool)
+    duplicate[np.flatnonzero(eligible.to_numpy())] = df[eligible].duplicated(subset=key, keep='first').to_numpy()
+    return [(f"{'+'.join(key)}:duplicate", pd.Series(duplicate, index=df.index))]
+
+def check_foreign_keys(df, foreign_keys, clean_tables):
+    """Flags rows whose key is not present in the already-validated parent table."""
+    failures = []
+    for col, parent, parent_col in foreign_keys:
+        parent_keys = clean_tables[parent][parent_col]
+        orphan = df[col].notna() & ~df[col].isin(parent_keys)
+        failures.append((f'{col}:fk_{parent}', orphan))
+    return failures
+
+
+# --- Stage ---
+
+def add_reasons(reasons, failures):
+    """Appends 'check;' to the reason string of every row each failing mask flags."""
+    for check, mask in failures:
+        reasons = reasons.where(~mask.fillna(False), reasons + check + ';')
+    return reasons
+
+def validate_tables(tables, reject_file='rejects.csv'):
+    """
+    Validates the preprocessed tables before any insert.
+    `tables` maps table name to DataFrame and must be ordered parents-first, as for the load.
+    Returns (clean_tables, rejects_df). Rejected rows are removed from the clean tables,
+    and rows referencing a rejected parent are rejected too.
+    The reject file's Row column is the row's index label in the incoming frame; for tables
+    filtered straight from a raw CSV (e.g. playerstat) that is its 0-based data row in the CSV.
+    """
+    print("Starting data validation...")
+    clean_tables = {}
+    reject_frames = []
+
+    for table_name, df in tables.items():
+        failures = check_columns(df, COLUMN_RULES.get(table_name, {}))
+        failures += check_foreign_keys(df, FOREIGN_KEYS.get(table_name, []), clean_tables)
+        reasons = add_reasons(pd.Series('', index=df.index), failures)
+
+        # Uniqueness is checked last, over the rows that passed everything else
+        if table_name in UNIQUE_KEYS:
+            reasons = add_reasons(reasons, check_unique(df, UNIQUE_KEYS[table_name], reasons == ''))
+        rejected = reasons != ''
+
+        clean_tables[table_name] = df[~rejected].copy()
+        if rejected.any():
+            reject_frames.append(pd.DataFrame({
+                'Table': table_name,
+                'Row': df.index[rejected],
+                'Reasons': reasons[rejected].str.rstrip(';').values,
+                'Record': [str(r) for r in df[rejected].to_dict('records')],
+            }))
+        print(f"-> {table_name}: {len(df)} rows checked, {int(rejected.sum())} rejected.")
+
+    rejects_df = (
+        pd.concat(reject_frames, ignore_index=True) if reject_frames
+        else pd.DataFrame(columns=['Table', 'Row', 'Reasons', 'Record'])
+    )
+    if reject_file:
+        rejects_df.to_csv(reject_file, index=False)
+        print(f"Saved {len(rejects_df)} rejected rows to {reject_file}")
+    return clean_tables, rejects_df
@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+
+# Seasons are keyed by their start year ('2020-21' -> 2020). Composite keys
+# pack (player, year) into one int64 so a single sorted array can be searched.
+YEAR_SPAN = 10_000
+
+
+def season_start_year(seasons):
+    """Vectorized 'YYYY-YY' / 'YYYY-YYYY' -> start year (float, NaN where unparseable)."""
+    seasons = pd.Series(seasons).astype(str).str.strip()
+    years = pd.to_numeric(seasons.str[:4], errors='coerce')
+    # Spreadsheet-mangled seasons in PlayerTeamHistory.csv, e.g. '03-04' saved as 'Apr-03'
+    mangled = pd.to_numeric(seasons.str.extract(r'^[A-Za-z]{3}-(\d{2})$')[0], errors='coerce')
+    return years.fillna(2000 + mangled).to_numpy(dtype=float)
+
+def season_label(start_years):
+    """Vectorized start year -> 'YYYY-YY' season string."""
+    years = pd.Series(start_years).astype(int)
+    return years.astype(str) + '-' + ((years + 1) % 100).astype(str).str.zfill(2)
+
+
+def expand_seasons(player_ids, team_ids, start_years, end_years):
+    """Vectorized stints -> one (PlayerID, TeamID, Year, Start) row per season each stint covers."""
+    lengths = np.clip(np.asarray(end_years) - np.asarray(start_years) + 1, 0, None)
+    stint_idx = np.repeat(np.arange(len(lengths)), lengths)
+    # Offset of each expanded row within its stint: 0, 1, ..., length - 1
+    offsets = np.arange(len(stint_idx)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return pd.DataFrame({
+        'PlayerID': np.asarray(player_ids)[stint_idx],
+        'TeamID': np.asarray(team_ids)[stint_idx],
+        'Year': np.asarray(start_years)[stint_idx] + offsets,
+        'Start': np.asarray(start_years)[stint_idx],
+    })
+
+def resolve_season_teams(seasons):
+    """
+    Picks one team per (PlayerID, Year) from expanded stint rows that may overlap.
+
+    The history only says which teams a player played for in a season, not in what order,
+    so the pick is a deterministic best guess at the team the player finished the season with:
+      1. a team the player is also with in their next season,
+      2. otherwise a team they were not with in their previous season (joined this season),
+      3. otherwise the stint that started later, then the lower TeamID.
+    """
+    seasons = seasons.drop_duplicates(subset=['PlayerID', 'TeamID', 'Year'])
+    years = seasons[['PlayerID', 'Year']].drop_duplicates().sort_values(['PlayerID', 'Year'])
+    years['Next'] = years.groupby('PlayerID')['Year'].shift(-1)
+    years['Prev'] = years.groupby('PlayerID')['Year'].shift(1)
+    seasons = seasons.merge(years, on=['PlayerID', 'Year'])
+
+    team_years = pd.MultiIndex.from_frame(seasons[['PlayerID', 'TeamID', 'Year']])
+    def has_team_in(col):
+        keys = pd.MultiIndex.from_arrays([seasons['PlayerID'], seasons['TeamID'], seasons[col].fillna(-1).astype(np.int64)])
+        return keys.isin(team_years)
+
+    seasons['MatchesNext'] = has_team_in('Next')
+    seasons['NewThisSeason'] = ~has_team_in('Prev')
+    seasons['NegTeamID'] = -seasons['TeamID']
+    seasons = seasons.sort_values(['PlayerID', 'Year', 'MatchesNext', 'NewThisSeason', 'Start', 'NegTeamID'])
+    return seasons.drop_duplicates(subset=['PlayerID', 'Year'], keep='last')[['PlayerID', 'TeamID', 'Year']]
+
+
+class PlayerTeamTimeline:
+    """
+    Interval index over PlayerTeamHistory stints for as-of "team for (player, season)" lookups.
+
+    Stints can overlap: a player traded mid-season has a stint with each team covering that
+    season, and stints may nest. When the index is built those overlaps are resolved to one
+    team per (player, season) (see `resolve_season_teams`), and consecutive seasons with the
+    same team are merged back into non-overlapping intervals sorted by (player, start season).
+    A lookup then finds the last interval starting at or before the season with one
+    `searchsorted` over the whole query, and checks it hasn't ended yet.
+    """
+
+    def __init__(self, player_ids, team_ids, start_years, end_years):
+        seasons = resolve_season_teams(expand_seasons(
+            np.asarray(player_ids, dtype=np.int64), np.asarray(team_ids, dtype=np.int64),
+            np.asarray(start_years, dtype=np.int64), np.asarray(end_years, dtype=np.int64),
+        )).sort_values(['PlayerID', 'Year'])
+
+        # Merge runs of consecutive seasons with the same team into one interval
+        player, team, year = (seasons[c].to_numpy(dtype=np.int64) for c in ('PlayerID', 'TeamID', 'Year'))
+        new_run = np.ones(len(seasons), dtype=bool)
+        new_run[1:] = (player[1:] != player[:-1]) | (team[1:] != team[:-1]) | (year[1:] != year[:-1] + 1)
+        starts = np.flatnonzero(new_run)
+        ends = np.append(starts[1:], len(seasons))[:len(starts)] - 1
+
+        self.player_ids = player[starts]
+        self.team_ids = team[starts]
+        self.start_years = year[starts]
+        self.end_years = year[ends]
+        self.keys = self.player_ids * YEAR_SPAN + self.start_years
+
+    @classmethod
+    def from_history(cls, history_df):
+        """Builds the index from PlayerTeamHistory.csv rows (Player_ID, TEAM_ID, StartSeason, EndSeason)."""
+        start_years = season_start_year(history_df['StartSeason'])
+        end_years = season_start_year(history_df['EndSeason'])
+        player_ids = pd.to_numeric(history_df['Player_ID'], errors='coerce').to_numpy(dtype=float)
+        team_ids = pd.to_numeric(history_df['TEAM_ID'], errors='coerce').to_numpy(dtype=float)
+
+        # Drop unparseable stints and the 'TOT' (team 0) multi-team summary rows
+        valid = ~(np.isnan(start_years) | np.isnan(end_years) | np.isnan(player_ids) | np.isnan(team_ids))
+        valid[valid] = team_ids[valid] != 0
+        return cls(player_ids[valid], team_ids[valid], start_years[valid], end_years[valid])
+
+    def __len__(self):
+        return len(self.keys)
+
+    def team_for(self, player_ids, seasons):
+        """
+        Returns the TeamID for each (player, season) pair as a float array, NaN where the
+        player has no team recorded for that season. `seasons` may be season strings or start years.
+        """
+        player_ids = np.asarray(player_ids, dtype=float)
+        seasons = np.asarray(seasons)
+        years = seasons.astype(float) if np.issubdtype(seasons.dtype, np.number) else season_start_year(seasons)
+
+        result = np.full(len(player_ids), np.nan)
+        valid = ~(np.isnan(player_ids) | np.isnan(years))
+        if not valid.any() or not len(self.keys):
+            return result
+
+        query_players = player_ids[valid].astype(np.int64)
+        query_years = years[valid].astype(np.int64)
+        idx = np.searchsorted(self.keys, query_players * YEAR_SPAN + query_years, side='right') - 1
+
+        safe_idx = np.clip(idx, 0, None)
+        hit = (idx >= 0) & (self.player_ids[safe_idx] == query_players) & (self.end_years[safe_idx] >= query_years)
+        teams = np.where(hit, self.team_ids[safe_idx], np.nan)
+        result[valid] = teams
+        return result
+
+    def player_team_seasons(self):
+        """Expands the intervals into one (PlayerID, TeamID, Season) row per player per season."""
+        seasons = expand_seasons(self.player_ids, self.team_ids, self.start_years, self.end_years)
+        seasons['Season'] = season_label(seasons['Year']).to_numpy()
+        return seasons[['PlayerID', 'TeamID', 'Season']]
@@ -0,0 +1,17 @@
+-- Schema additions for the player-team timeline (PlayerTeamTimeline.py).
+-- Apply once to NBAdatabase before running the load; DataImport.main skips
+-- the new table and column if they are missing.
+
+CREATE TABLE IF NOT EXISTS `playerteamseason` (
+    `PlayerID` INT NOT NULL,
+    `TeamID` INT NOT NULL,
+    `Season` VARCHAR(7) NOT NULL,
+    PRIMARY KEY (`PlayerID`, `Season`),
+    FOREIGN KEY (`PlayerID`) REFERENCES `player` (`PlayerID`),
+    FOREIGN KEY (`TeamID`) REFERENCES `team` (`TeamID`)
+);
+
+-- Team the player was on in the salary's season (NULL when the history has no stint for it)
+ALTER TABLE `salary`
+    ADD COLUMN `TeamID` INT NULL AFTER `PlayerID`,
+    ADD FOREIGN KEY (`TeamID`) REFERENCES `team` (`TeamID`);
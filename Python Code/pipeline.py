@@ -0,0 +1,186 @@
+"""
+Single entry point for the NBA data pipeline.
+
+    python pipeline.py scrape all --out-dir raw
+    python pipeline.py crawl --workers 8 --min-interval 0.75 --out-dir raw
+    python pipeline.py preprocess --data-dir raw --out-dir cleaned
+    python pipeline.py validate --data-dir raw --reject-file rejects.csv
+    python pipeline.py load --data-dir raw
+    python pipeline.py benchmark --data-dir raw --repeat 3
+
+--data-dir must hold the file names DataImport.preprocess_data reads: the three
+ESPN outputs written by `scrape`, player.csv, 'player team history.csv' and
+'player awards.csv' written by `crawl`, plus teams.csv and 'Player data.csv'
+from NBAAPIDataExtraction.ipynb. The CSVs checked into Data/ use other
+names (e.g. PlayerTeamHistory.csv) and have no salary file, so they can't be
+passed as --data-dir directly.
+
+Every subcommand exits non-zero when its job failed, so a scheduler can tell.
+
+Only the standard library is imported up front. Each subcommand imports the
+script it drives (and therefore pandas / bs4 / mysql.connector) when it runs,
+so `--help` and short scheduler jobs don't pay for dependencies they never use.
+"""
+import argparse
+import importlib
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+EXTRACTION_DIR = os.path.join(HERE, "Data Extraction")
+IMPORT_DIR = os.path.join(HERE, "Data Import")
+
+# Output tables of DataImport.preprocess_data, in the order it returns them
+TABLE_NAMES = ["team", "awardtype", "player", "playeraward", "playerstat", "salary", "teamseasonstat",
+               "playerteamseason"]
+
+# scrape target -> (module in "Data Extraction", default first/last ESPN end year, output file)
+SCRAPERS = {
+    "salaries": ("espnsalaries", 2001, 2025, "nba_salaries_2000-01_to_2024-25.csv"),
+    "attendance": ("espnattendance", 2001, 2025, "nba_attendance_2000-01_to_2024-25.csv"),
+    "standings": ("teamstats", 2003, 2025, "nba_standings_2002_2003_to_2024_2025_espn.csv"),
+}
+
+
+def _load(module_name, directory):
+    """Import one of the pipeline scripts by name (their folders aren't packages)."""
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    return importlib.import_module(module_name)
+
+
+def run_scrape(args):
+    targets = list(SCRAPERS) if args.target == "all" else [args.target]
+    os.makedirs(args.out_dir, exist_ok=True)
+    status = 0
+    for target in targets:
+        module_name, default_start, default_end, out_file = SCRAPERS[target]
+        module = _load(module_name, EXTRACTION_DIR)
+        start = args.start if args.start is not None else default_start
+        end = args.end if args.end is not None else default_end
+        print(f"=== Scraping {target} ({start}..{end}) ===")
+        status |= module.main(start_end_year=start, end_end_year=end,
+                              out_file=os.path.join(args.out_dir, out_file))
+    return status
+
+
+def run_crawl(args):
+    crawler = _load("nbaapicrawler", EXTRACTION_DIR)
+    return crawler.main(max_workers=args.workers, min_interval=args.min_interval, limit=args.limit,
+                        out_dir=args.out_dir)
+
+
+def run_preprocess(args):
+    data_import = _load("DataImport", IMPORT_DIR)
+    frames = data_import.preprocess_data(args.data_dir)
+    if frames[0] is None:
+        return 1
+
+    if args.out_dir:
+        # Validate first so the written tables are the ones `load` would insert
+        tables, _ = data_import.validate_tables(dict(zip(TABLE_NAMES, frames)), reject_file=args.reject_file)
+        os.makedirs(args.out_dir, exist_ok=True)
+        for name, df in tables.items():
+            out_file = os.path.join(args.out_dir, f"{name}.csv")
+            df.to_csv(out_file, index=False)
+            print(f"Saved {len(df)} rows to {out_file}")
+    return 0
+
+
+def run_validate(args):
+    data_import = _load("DataImport", IMPORT_DIR)
+    frames = data_import.preprocess_data(args.data_dir)
+    if frames[0] is None:
+        return 1
+
+    _, rejects_df = data_import.validate_tables(dict(zip(TABLE_NAMES, frames)), reject_file=args.reject_file)
+    return 1 if len(rejects_df) else 0
+
+
+def run_load(args):
+    data_import = _load("DataImport", IMPORT_DIR)
+    return data_import.main(args.data_dir, reject_file=args.reject_file)
+
+
+def run_benchmark(args):
+    """Time the import cost of each stage's dependencies and repeated preprocessing + validation runs."""
+    for label, module_name in [("pandas", "pandas"), ("numpy", "numpy")]:
+        start = time.perf_counter()
+        importlib.import_module(module_name)
+        print(f"import {label}: {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    data_import = _load("DataImport", IMPORT_DIR)
+    print(f"import DataImport: {time.perf_counter() - start:.3f}s")
+
+    timings = {"preprocess_data": [], "validate_tables": []}
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        frames = data_import.preprocess_data(args.data_dir)
+        timings["preprocess_data"].append(time.perf_counter() - start)
+        if frames[0] is None:
+            return 1
+
+        start = time.perf_counter()
+        data_import.validate_tables(dict(zip(TABLE_NAMES, frames)), reject_file=None)
+        timings["validate_tables"].append(time.perf_counter() - start)
+
+    print()
+    for stage, runs in timings.items():
+        print(f"{stage} x{args.repeat}: "
+              f"min {min(runs):.3f}s, mean {sum(runs) / len(runs):.3f}s, max {max(runs):.3f}s")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="NBA analytics data pipeline")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    scrape = subparsers.add_parser("scrape", help="scrape ESPN data to CSV")
+    scrape.add_argument("target", choices=list(SCRAPERS) + ["all"])
+    scrape.add_argument("--start", type=int, help="first season end year (e.g. 2001 for 2000-01)")
+    scrape.add_argument("--end", type=int, help="last season end year, inclusive")
+    scrape.add_argument("--out-dir", default=".", help="directory to write the scraped CSVs to")
+    scrape.set_defaults(func=run_scrape)
+
+    crawl = subparsers.add_parser("crawl", help="crawl player info, team history, draft and awards from nba_api")
+    crawl.add_argument("--workers", type=int, default=8, help="concurrent endpoint calls")
+    crawl.add_argument("--min-interval", type=float, default=0.75,
+                       help="minimum seconds between request starts, across all workers")
+    crawl.add_argument("--limit", type=int, help="only crawl the first N active players")
+    crawl.add_argument("--out-dir", default=".", help="directory to write the crawled CSVs to")
+    crawl.set_defaults(func=run_crawl)
+
+    preprocess = subparsers.add_parser("preprocess", help="clean the raw CSVs without touching the database")
+    preprocess.add_argument("--data-dir", default=".", help="directory containing the raw CSV files")
+    preprocess.add_argument("--out-dir", help="validate, then write the cleaned tables as CSVs to this directory")
+    preprocess.add_argument("--reject-file", default="rejects.csv",
+                            help="where to write rows rejected by validation (with --out-dir)")
+    preprocess.set_defaults(func=run_preprocess)
+
+    validate = subparsers.add_parser("validate", help="preprocess and run the pre-load data checks; exits 1 on rejects")
+    validate.add_argument("--data-dir", default=".", help="directory containing the raw CSV files")
+    validate.add_argument("--reject-file", default="rejects.csv", help="where to write rejected rows")
+    validate.set_defaults(func=run_validate)
+
+    load = subparsers.add_parser("load", help="preprocess, validate and insert into MySQL")
+    load.add_argument("--data-dir", default=".", help="directory containing the raw CSV files")
+    load.add_argument("--reject-file", default="rejects.csv", help="where to write rejected rows")
+    load.set_defaults(func=run_load)
+
+    benchmark = subparsers.add_parser("benchmark", help="time imports and preprocessing")
+    benchmark.add_argument("--data-dir", default=".", help="directory containing the raw CSV files")
+    benchmark.add_argument("--repeat", type=int, default=3, help="number of preprocessing runs")
+    benchmark.set_defaults(func=run_benchmark)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
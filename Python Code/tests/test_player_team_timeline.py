@@ -0,0 +1,122 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "Data Import"))
+
+from PlayerTeamTimeline import PlayerTeamTimeline, expand_seasons, resolve_season_teams, season_start_year
+
+HISTORY_CSV = os.path.join(HERE, "..", "..", "Data", "PlayerTeamHistory.csv")
+
+
+def resolve(stints):
+    """stints: [(player, team, start year, end year)] -> {(player, year): team}"""
+    player_ids, team_ids, starts, ends = (np.array(col) for col in zip(*stints))
+    resolved = resolve_season_teams(expand_seasons(player_ids, team_ids, starts, ends))
+    return {(p, y): t for p, t, y in resolved.itertuples(index=False)}
+
+
+# --- season parsing ---
+
+def test_season_start_year_formats():
+    years = season_start_year(['2020-21', '2003-2004', 'Apr-03', 'garbage', None])
+    assert years[:3].tolist() == [2020, 2003, 2003]
+    assert np.isnan(years[3:]).all()
+
+
+# --- resolve_season_teams rules ---
+
+def test_prefers_team_kept_next_season():
+    # Traded from 10 to 20 in 2012; both stints cover 2012, only 20 continues into 2013
+    assert resolve([(1, 20, 2012, 2014), (1, 10, 2010, 2012)])[(1, 2012)] == 20
+
+def test_prefers_team_joined_this_season_when_neither_continues():
+    # Final season split between 10 (since 2010) and 20 (joined 2012)
+    assert resolve([(1, 20, 2012, 2012), (1, 10, 2010, 2012)])[(1, 2012)] == 20
+
+def test_falls_back_to_later_start_then_lower_team_id():
+    # Single-season player on two teams: same start, neither continues -> lower TeamID
+    assert resolve([(1, 30, 2015, 2015), (1, 20, 2015, 2015)])[(1, 2015)] == 20
+    # Both teams carried over from last season, neither continues -> the later stint
+    assert resolve([(1, 10, 2010, 2012), (1, 20, 2011, 2012)])[(1, 2012)] == 20
+
+def test_resolution_ignores_input_order():
+    stints = [(1, 10, 2010, 2012), (1, 20, 2012, 2012), (1, 30, 2012, 2013)]
+    assert resolve(stints) == resolve(stints[::-1])
+
+
+# --- lookups ---
+
+@pytest.fixture
+def timeline():
+    # Player 1: team 10 2010-12, gap in 2013, team 20 2014-15. Player 2: team 30 2020-21.
+    return PlayerTeamTimeline([1, 1, 2], [10, 20, 30], [2010, 2014, 2020], [2012, 2015, 2021])
+
+def test_hits(timeline):
+    teams = timeline.team_for([1, 1, 1, 2], [2010, 2012, 2015, 2021])
+    assert teams.tolist() == [10, 10, 20, 30]
+
+def test_accepts_season_strings(timeline):
+    assert timeline.team_for([1, 2], ['2011-12', '2020-21']).tolist() == [10, 30]
+
+@pytest.mark.parametrize("player_id, season", [
+    (1, 2009),          # before the first stint
+    (1, 2013),          # gap between stints
+    (1, 2016),          # after the last stint
+    (2, 2019),          # before the first stint, with an earlier player's interval just below
+    (3, 2015),          # unknown player
+    (np.nan, 2015),     # missing player
+])
+def test_misses_are_nan(timeline, player_id, season):
+    assert np.isnan(timeline.team_for([player_id], [season])).all()
+
+def test_missing_season_is_nan(timeline):
+    assert np.isnan(timeline.team_for([1], [np.nan])).all()
+    assert np.isnan(timeline.team_for([1, 1], ['2011-12', None]))[1]
+    assert timeline.team_for([1, 1], ['2011-12', None])[0] == 10
+
+def test_nested_overlap_keeps_outer_stint_around_it():
+    # Stint with 20 nested inside 10's; 10 is kept on both sides and in 2012, where it continues
+    timeline = PlayerTeamTimeline([1, 1], [10, 20], [2010, 2012], [2015, 2012])
+    assert timeline.team_for([1] * 7, range(2010, 2017))[:6].tolist() == [10] * 6
+    assert np.isnan(timeline.team_for([1], [2016])).all()
+
+def test_empty_timeline():
+    timeline = PlayerTeamTimeline([], [], [], [])
+    assert len(timeline) == 0
+    assert np.isnan(timeline.team_for([1], [2010])).all()
+    assert timeline.player_team_seasons().empty
+
+
+# --- player_team_seasons ---
+
+def test_player_team_seasons_one_row_per_player_season(timeline):
+    seasons = timeline.player_team_seasons()
+    assert not seasons.duplicated(subset=['PlayerID', 'Season']).any()
+    assert seasons[seasons['PlayerID'] == 1]['Season'].tolist() == [
+        '2010-11', '2011-12', '2012-13', '2014-15', '2015-16']
+
+
+# --- real history ---
+
+@pytest.mark.skipif(not os.path.exists(HISTORY_CSV), reason="Data/PlayerTeamHistory.csv not present")
+def test_real_history_traded_players():
+    timeline = PlayerTeamTimeline.from_history(pd.read_csv(HISTORY_CSV))
+    teams = pd.read_csv(os.path.join(os.path.dirname(HISTORY_CSV), "teams.csv"))
+    team_ids = dict(zip(teams['Abbreviation'], teams['Team ID']))
+
+    cases = [  # (player, season, team)
+        (203915, '2021-22', 'DAL'),  # Spencer Dinwiddie, WAS -> DAL
+        (203915, '2023-24', 'LAL'),  # BKN -> LAL
+        (1628963, '2024-25', 'WAS'),  # Marvin Bagley III
+        (203083, '2019-20', 'CLE'),   # Andre Drummond, DET -> CLE
+        (203083, '2020-21', 'LAL'),
+        (203083, '2021-22', 'BKN'),
+    ]
+    player_ids, seasons, expected = zip(*cases)
+    assert timeline.team_for(player_ids, seasons).tolist() == [team_ids[t] for t in expected]
+    assert not timeline.player_team_seasons().duplicated(subset=['PlayerID', 'Season']).any()